@@ -5,15 +5,143 @@ Handles creation of Plotly charts and visualizations
 
 import sys
 import os
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from zoneinfo import ZoneInfo
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
 import plotly.graph_objects as go
-import pytz
+import plotly.io as pio
+from tsdownsample import MinMaxLTTBDownsampler
 
 # Add the project root to Python path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
-from core.config import COLORS, CHART_CONFIG, CHART_LABELS
+from core.config import COLORS, CHART_CONFIG, CHART_LABELS, AUTO_REFRESH_INTERVAL
+
+# Serialize figures with orjson rather than the stdlib json encoder
+pio.json.config.default_engine = 'orjson'
+
+# Shared downsampler instance (stateless, safe to reuse across redraws)
+_DOWNSAMPLER = MinMaxLTTBDownsampler()
+
+# Built figures are reused while the prepared data is unchanged (the dashboard reruns far more often than data arrives)
+_FIGURE_CACHE_SIZE = 8
+_FIGURE_CACHE_TTL = AUTO_REFRESH_INTERVAL  # seconds
+
+# Chart settings resolved once at import instead of on every redraw
+_MAX_POINTS = CHART_CONFIG['max_points']
+_PRICE_LINE_COLOR = CHART_CONFIG['price_line_color']
+_VOLUME_COLOR = CHART_CONFIG['volume_bar_color']
+_PRICE_TITLE_FMT = CHART_LABELS['price_chart_title']
+_VOLUME_TITLE_FMT = CHART_LABELS['volume_chart_title']
+_VOLUME_NAME = CHART_LABELS['volume_name']
+
+# Static layout parts, built once at import; only the title depends on the timezone
+_TITLE_STYLE = {
+    'x': 0.5,
+    'xanchor': 'center',
+    'font': {'size': 20, 'color': '#1f2937'}
+}
+
+_PRICE_LAYOUT_BASE = dict(
+    xaxis=dict(
+        title=dict(text=CHART_LABELS['time_axis']),
+        type='date',
+        gridcolor=CHART_CONFIG['grid_color'],
+        showgrid=True
+    ),
+    yaxis=dict(
+        title=dict(text=CHART_LABELS['price_axis']),
+        gridcolor=CHART_CONFIG['grid_color'],
+        showgrid=True,
+        tickformat=CHART_CONFIG['tick_format_currency']
+    ),
+    plot_bgcolor=CHART_CONFIG['background_color'],
+    paper_bgcolor=CHART_CONFIG['background_color'],
+    hovermode=CHART_CONFIG['hover_mode'],
+    height=500
+)
+
+_COMBINED_LAYOUT_BASE = dict(
+    xaxis=dict(
+        title=dict(text=CHART_LABELS['time_axis']),
+        type='date',
+        gridcolor=CHART_CONFIG['grid_color'],
+        showgrid=True,
+        domain=[0, 1]
+    ),
+    # Primary y-axis (left) - Price
+    yaxis=dict(
+        title=dict(text=CHART_LABELS['price_axis']),
+        gridcolor=CHART_CONFIG['grid_color'],
+        showgrid=True,
+        tickformat=CHART_CONFIG['tick_format_currency'],
+        side='left'
+    ),
+    # Secondary y-axis (right) - Volume
+    yaxis2=dict(
+        title=dict(
+            text='Trading Volume (USD)',
+            font=dict(color=CHART_CONFIG['volume_bar_color'])
+        ),
+        tickformat='$,.0s',
+        side='right',
+        overlaying='y',
+        showgrid=False,
+        tickfont=dict(color=CHART_CONFIG['volume_bar_color'])
+    ),
+    plot_bgcolor=CHART_CONFIG['background_color'],
+    paper_bgcolor=CHART_CONFIG['background_color'],
+    hovermode='x unified',
+    height=600,  # Slightly taller to accommodate dual axes
+    showlegend=True,
+    legend=dict(
+        x=0.02,
+        y=0.98,
+        bgcolor='rgba(255, 255, 255, 0.8)',
+        bordercolor='rgba(0, 0, 0, 0.2)',
+        borderwidth=1
+    )
+)
+
+_VOLUME_LAYOUT_BASE = dict(
+    xaxis=dict(title=dict(text=CHART_LABELS['time_axis']), type='date', gridcolor=CHART_CONFIG['grid_color']),
+    yaxis=dict(title=dict(text=CHART_LABELS['volume_axis']), gridcolor=CHART_CONFIG['grid_color'], tickformat=CHART_CONFIG['tick_format_currency']),
+    plot_bgcolor=CHART_CONFIG['background_color'],
+    paper_bgcolor=CHART_CONFIG['background_color'],
+    height=300
+)
+
+
+def _build_layout(layout_base, title_text):
+    """Return a layout dict from a static template plus the per-call title"""
+    layout = layout_base.copy()
+    layout['title'] = {'text': title_text, **_TITLE_STYLE}
+    return layout
+
+
+@lru_cache(maxsize=64)
+def _get_timezone(timezone_name):
+    """Return a cached ZoneInfo object for the given name"""
+    return ZoneInfo(timezone_name)
+
+
+def _fixed_utc_offset(target_tz, start, end):
+    """Return target_tz's UTC offset if it does not change between two naive UTC timestamps, else None"""
+    if pd.isna(start) or pd.isna(end):
+        return None
+    
+    # Probe the offset daily across the range (offset changes never revert within a day)
+    probes = pd.date_range(start, end, freq='D').append(pd.DatetimeIndex([end]))
+    local_probes = probes.tz_localize('UTC').tz_convert(target_tz).tz_localize(None)
+    offsets = (local_probes - probes).unique()
+    return offsets[0] if len(offsets) == 1 else None
 
 
 def _convert_timestamps_to_timezone(df, timezone_name=None):
@@ -21,194 +149,192 @@ def _convert_timestamps_to_timezone(df, timezone_name=None):
     if df.empty or timezone_name is None:
         return df
     
-    df_local = df.copy()
+    # Normalize to naive UTC (naive input is assumed to be UTC); only parse non-datetime columns
+    timestamps = df['timestamp']
+    if timezone_name == 'UTC' and is_datetime64_any_dtype(timestamps) and timestamps.dt.tz is None:
+        # Already naive UTC, which is exactly what the UTC charts plot - nothing to rebuild
+        return df
+    if not is_datetime64_any_dtype(timestamps):
+        timestamps = pd.to_datetime(timestamps, utc=True, format='ISO8601')
+    if timestamps.dt.tz is not None:
+        timestamps = timestamps.dt.tz_convert('UTC').dt.tz_localize(None)
+    
+    # Plotly gets naive local wall-clock times, which serialize as a plain datetime64 array
+    # (the chart titles already name the timezone)
     try:
         if timezone_name and timezone_name != 'UTC':
-            # Ensure timestamps are timezone-aware (assume UTC if naive)
-            df_local['timestamp'] = pd.to_datetime(df_local['timestamp'], utc=True)
-            # Convert to target timezone
-            target_tz = pytz.timezone(timezone_name)
-            df_local['timestamp'] = df_local['timestamp'].dt.tz_convert(target_tz)
-        else:
-            # Ensure UTC timezone is set
-            df_local['timestamp'] = pd.to_datetime(df_local['timestamp'], utc=True)
+            target_tz = _get_timezone(timezone_name)
+            offset = _fixed_utc_offset(target_tz, timestamps.min(), timestamps.max())
+            if offset is not None:
+                # No DST transition in range: a single vectorized shift replaces the tz lookup
+                timestamps = timestamps + offset
+            else:
+                timestamps = timestamps.dt.tz_localize('UTC').dt.tz_convert(target_tz).dt.tz_localize(None)
     except Exception as e:
         print(f"Timezone conversion error: {e}")
         # Fallback to UTC if conversion fails
-        df_local['timestamp'] = pd.to_datetime(df_local['timestamp'], utc=True)
     
-    return df_local
+    # Replace only the timestamp column; the other columns are shared rather than copied
+    return df.assign(timestamp=timestamps)
+
+
+def _downsample_for_plot(df_local, value_column='price'):
+    """Reduce the DataFrame to at most CHART_CONFIG['max_points'] rows, preserving the shape of value_column"""
+    n_out = _MAX_POINTS
+    if len(df_local) <= n_out:
+        return df_local
+    
+    x = df_local['timestamp'].values.astype('datetime64[ns]').view('int64')
+    y = df_local[value_column].to_numpy(dtype=np.float64)
+    idx = _DOWNSAMPLER.downsample(x, y, n_out=n_out)
+    # Index every column by the same positions so all traces stay aligned
+    return df_local.iloc[idx]
+
+
+def _float_values(series):
+    """Return a column as a float ndarray, keeping float32 columns at single precision"""
+    dtype = np.float32 if series.dtype == np.float32 else np.float64
+    return series.to_numpy(dtype=dtype, na_value=np.nan)
+
 
+def _trace_arrays(df_local, value_column):
+    """Return (x, y) as numeric ndarrays so Plotly ships them as base64 typed arrays"""
+    # Epoch milliseconds of the (naive, local) wall-clock times; the x axes are typed as dates
+    x = df_local['timestamp'].to_numpy(dtype='datetime64[ms]').astype(np.int64).astype(np.float64)
+    return x, _float_values(df_local[value_column])
 
-def create_price_chart(df, timezone_name=None):
-    """Create interactive price chart with timezone support"""
+
+def _cached_figure(builder):
+    """Memoize a chart builder on a cheap fingerprint of its prepared frame (callers must not mutate the figure)"""
+    cache = OrderedDict()
+    cache_lock = threading.Lock()
+    
+    @wraps(builder)
+    def wrapper(df_local, timezone_name=None):
+        if df_local.empty:
+            return builder(df_local, timezone_name)
+        
+        # First and last timestamps distinguish time ranges that downsample to the same row count
+        timestamps = df_local['timestamp']
+        key = (timestamps.iat[0], timestamps.iat[-1], len(df_local), timezone_name)
+        now = time.monotonic()
+        with cache_lock:
+            hit = cache.get(key)
+            if hit is not None and now - hit[0] < _FIGURE_CACHE_TTL:
+                cache.move_to_end(key)
+                return hit[1]
+        
+        fig = builder(df_local, timezone_name)
+        with cache_lock:
+            cache[key] = (now, fig)
+            cache.move_to_end(key)
+            while len(cache) > _FIGURE_CACHE_SIZE:
+                cache.popitem(last=False)
+        return fig
+    
+    return wrapper
+
+
+def prepare_chart_frame(df, timezone_name=None):
+    """Convert timestamps and downsample once per refresh; the result is shared by all chart builders"""
     if df.empty:
-        return go.Figure()
+        return df
     
-    # Convert timestamps to local timezone
     df_local = _convert_timestamps_to_timezone(df, timezone_name)
+    return _downsample_for_plot(df_local)
+
+
+@_cached_figure
+def create_price_chart(df_local, timezone_name=None):
+    """Create interactive price chart with timezone support (expects a frame from prepare_chart_frame)"""
+    if df_local.empty:
+        return go.Figure()
     
-    fig = go.Figure()
-    
-    # Add price line
-    fig.add_trace(go.Scatter(
-        x=df_local['timestamp'],
-        y=df_local['price'],
+    # Price line
+    x, prices = _trace_arrays(df_local, 'price')
+    data = [dict(
+        type='scattergl',
+        x=x,
+        y=prices,
         mode='lines',
         name='Bitcoin Price',
-        line=dict(color=CHART_CONFIG['price_line_color'], width=2),
+        line=dict(color=_PRICE_LINE_COLOR, width=2),
         hovertemplate='<b>Price: $%{y:,.2f}</b><br>Time: %{x}<extra></extra>'
-    ))
-    
-    # Update layout to match CoinMarketCap style
-    chart_title = CHART_LABELS['price_chart_title'].format(timezone=timezone_name if timezone_name else "UTC")
-    fig.update_layout(
-        title={
-            'text': chart_title,
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 20, 'color': '#1f2937'}
-        },
-        xaxis=dict(
-            title=CHART_LABELS['time_axis'],
-            gridcolor=CHART_CONFIG['grid_color'],
-            showgrid=True
-        ),
-        yaxis=dict(
-            title=CHART_LABELS['price_axis'],
-            gridcolor=CHART_CONFIG['grid_color'],
-            showgrid=True,
-            tickformat=CHART_CONFIG['tick_format_currency']
-        ),
-        plot_bgcolor=CHART_CONFIG['background_color'],
-        paper_bgcolor=CHART_CONFIG['background_color'],
-        hovermode=CHART_CONFIG['hover_mode'],
-        height=500
-    )
+    )]
     
-    return fig
+    # Layout to match CoinMarketCap style
+    chart_title = _PRICE_TITLE_FMT.format(timezone=timezone_name if timezone_name else "UTC")
+    layout = _build_layout(_PRICE_LAYOUT_BASE, chart_title)
+    
+    # Build the figure in one pass; the trace and layout dicts are static and known to be valid
+    return go.Figure(dict(data=data, layout=layout), _validate=False)
 
 
-def create_combined_price_volume_chart(df, timezone_name=None):
-    """Create combined price and volume chart with dual y-axes"""
-    if df.empty:
+@_cached_figure
+def create_combined_price_volume_chart(df_local, timezone_name=None):
+    """Create combined price and volume chart with dual y-axes (expects a frame from prepare_chart_frame)"""
+    if df_local.empty:
         return go.Figure()
     
-    # Convert timestamps to local timezone
-    df_local = _convert_timestamps_to_timezone(df, timezone_name)
-    
-    # Create figure with secondary y-axis
-    fig = go.Figure()
-    
-    # Add price line (primary y-axis)
-    fig.add_trace(go.Scatter(
-        x=df_local['timestamp'],
-        y=df_local['price'],
+    # Price line (primary y-axis)
+    x, prices = _trace_arrays(df_local, 'price')
+    data = [dict(
+        type='scattergl',
+        x=x,
+        y=prices,
         mode='lines',
         name='Bitcoin Price',
-        line=dict(color=CHART_CONFIG['price_line_color'], width=3),
+        line=dict(color=_PRICE_LINE_COLOR, width=3),
         hovertemplate='<b>Price: $%{y:,.2f}</b><br>Time: %{x}<extra></extra>',
         yaxis='y'
-    ))
+    )]
     
-    # Add volume line (secondary y-axis) - only if volume data exists
-    if 'volume_24h' in df_local.columns and df_local['volume_24h'].notna().any():
-        fig.add_trace(go.Scatter(
-            x=df_local['timestamp'],
-            y=df_local['volume_24h'],
+    # Volume line (secondary y-axis) - only if volume data exists; the NaN check runs on the
+    # same array that is plotted, so the column is only materialized once
+    volumes = _float_values(df_local['volume_24h']) if 'volume_24h' in df_local.columns else None
+    if volumes is not None and not np.isnan(volumes).all():
+        data.append(dict(
+            type='scattergl',
+            x=x,
+            y=volumes,
             mode='lines',
             name='Trading Volume',
-            line=dict(color=CHART_CONFIG['volume_bar_color'], width=2),
+            line=dict(color=_VOLUME_COLOR, width=2),
             hovertemplate='<b>Volume: $%{y:,.0f}</b><br>Time: %{x}<extra></extra>',
             yaxis='y2'
         ))
     
-    # Update layout with dual y-axes
-    chart_title = CHART_LABELS['price_chart_title'].format(timezone=timezone_name if timezone_name else "UTC")
-    fig.update_layout(
-        title={
-            'text': f"{chart_title} with Trading Volume",
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 20, 'color': '#1f2937'}
-        },
-        xaxis=dict(
-            title=CHART_LABELS['time_axis'],
-            gridcolor=CHART_CONFIG['grid_color'],
-            showgrid=True,
-            domain=[0, 1]
-        ),
-        # Primary y-axis (left) - Price
-        yaxis=dict(
-            title=CHART_LABELS['price_axis'],
-            gridcolor=CHART_CONFIG['grid_color'],
-            showgrid=True,
-            tickformat=CHART_CONFIG['tick_format_currency'],
-            side='left'
-        ),
-        # Secondary y-axis (right) - Volume
-        yaxis2=dict(
-            title=dict(
-                text='Trading Volume (USD)',
-                font=dict(color=CHART_CONFIG['volume_bar_color'])
-            ),
-            tickformat='$,.0s',
-            side='right',
-            overlaying='y',
-            showgrid=False,
-            tickfont=dict(color=CHART_CONFIG['volume_bar_color'])
-        ),
-        plot_bgcolor=CHART_CONFIG['background_color'],
-        paper_bgcolor=CHART_CONFIG['background_color'],
-        hovermode='x unified',
-        height=600,  # Slightly taller to accommodate dual axes
-        showlegend=True,
-        legend=dict(
-            x=0.02,
-            y=0.98,
-            bgcolor='rgba(255, 255, 255, 0.8)',
-            bordercolor='rgba(0, 0, 0, 0.2)',
-            borderwidth=1
-        )
-    )
+    # Layout with dual y-axes
+    chart_title = _PRICE_TITLE_FMT.format(timezone=timezone_name if timezone_name else "UTC")
+    layout = _build_layout(_COMBINED_LAYOUT_BASE, f"{chart_title} with Trading Volume")
     
-    return fig
+    return go.Figure(dict(data=data, layout=layout), _validate=False)
 
 
-def create_volume_chart(df, timezone_name=None):
-    """Create interactive volume chart with timezone support"""
-    if df.empty or 'volume_24h' not in df.columns:
+@_cached_figure
+def create_volume_chart(df_local, timezone_name=None):
+    """Create interactive volume chart with timezone support (expects a frame from prepare_chart_frame)"""
+    if df_local.empty or 'volume_24h' not in df_local.columns:
         return go.Figure()
     
-    # Convert timestamps to local timezone
-    df_local = _convert_timestamps_to_timezone(df, timezone_name)
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Bar(
-        x=df_local['timestamp'],
-        y=df_local['volume_24h'],
-        name=CHART_LABELS['volume_name'],
-        marker_color=CHART_CONFIG['volume_bar_color'],
+    # Filled WebGL area instead of SVG bars: one DOM-free trace however many points are drawn
+    x, volumes = _trace_arrays(df_local, 'volume_24h')
+    data = [dict(
+        type='scattergl',
+        x=x,
+        y=volumes,
+        mode='lines',
+        fill='tozeroy',
+        name=_VOLUME_NAME,
+        line=dict(color=_VOLUME_COLOR, width=1),
+        fillcolor=_VOLUME_COLOR,
         hovertemplate='<b>Volume: $%{y:,.0f}</b><br>Time: %{x}<extra></extra>'
-    ))
-    
-    volume_title = CHART_LABELS['volume_chart_title'].format(timezone=timezone_name if timezone_name else "UTC")
-    fig.update_layout(
-        title={
-            'text': volume_title,
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 20, 'color': '#1f2937'}
-        },
-        xaxis=dict(title=CHART_LABELS['time_axis'], gridcolor=CHART_CONFIG['grid_color']),
-        yaxis=dict(title=CHART_LABELS['volume_axis'], gridcolor=CHART_CONFIG['grid_color'], tickformat=CHART_CONFIG['tick_format_currency']),
-        plot_bgcolor=CHART_CONFIG['background_color'],
-        paper_bgcolor=CHART_CONFIG['background_color'],
-        height=300
-    )
+    )]
+    
+    volume_title = _VOLUME_TITLE_FMT.format(timezone=timezone_name if timezone_name else "UTC")
+    layout = _build_layout(_VOLUME_LAYOUT_BASE, volume_title)
     
-    return fig
+    return go.Figure(dict(data=data, layout=layout), _validate=False)
 
 
 def create_statistics_display(df):
@@ -221,9 +347,18 @@ def create_statistics_display(df):
             'max_price': 0
         }
     
+    # Reduce over the raw buffer; the sum doubles as a NaN probe so the common gap-free case
+    # skips the NaN-masking copies (NaN-skipping fallback matches the pandas reductions)
+    prices = df['price'].to_numpy(dtype=np.float64)
+    total = prices.sum()
+    if np.isnan(total):
+        average, minimum, maximum = np.nanmean(prices), np.nanmin(prices), np.nanmax(prices)
+    else:
+        average, minimum, maximum = total / prices.size, prices.min(), prices.max()
+    
     return {
         'data_points': len(df),
-        'average_price': df['price'].mean(),
-        'min_price': df['price'].min(),
-        'max_price': df['price'].max()
+        'average_price': float(average),
+        'min_price': float(minimum),
+        'max_price': float(maximum)
     }
\ No newline at end of file
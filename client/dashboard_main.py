@@ -5,13 +5,17 @@ Orchestrates all dashboard components following Single Responsibility Principle
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
 import streamlit as st
 
 # Add the project root and client folder to Python path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 client_root = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, project_root)
-sys.path.insert(0, client_root)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+if client_root not in sys.path:
+    sys.path.insert(0, client_root)
 
 # Import modular components
 from session_manager import (
@@ -34,8 +38,31 @@ from ui_components import (
     display_footer
 )
 from sidebar_controls import render_all_sidebar_controls
-from chart_components import create_price_chart, create_combined_price_volume_chart, create_volume_chart, create_statistics_display
+from chart_components import (
+    prepare_chart_frame,
+    create_price_chart,
+    create_combined_price_volume_chart,
+    create_volume_chart,
+    create_statistics_display
+)
 from data_operations import get_price_data_from_db, get_current_price_from_api
+from core.config import AUTO_REFRESH_INTERVAL
+
+# The current-price and history requests are independent I/O; run them side by side
+_fetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="dashboard-fetch")
+
+
+def _frame_fingerprint(df):
+    """Cheap identity for a price frame: row count plus first and last timestamps"""
+    if df.empty:
+        return 0
+    return len(df), df['timestamp'].iat[0], df['timestamp'].iat[-1]
+
+
+@st.cache_data(max_entries=8, ttl=AUTO_REFRESH_INTERVAL, hash_funcs={pd.DataFrame: _frame_fingerprint})
+def get_chart_frame(df, timezone_name):
+    """Prepare the chart frame, reusing the result across reruns while the data is unchanged"""
+    return prepare_chart_frame(df, timezone_name)
 
 
 def main():
@@ -56,9 +83,19 @@ def main():
     selected_timezone = sidebar_state['selected_timezone']
     time_range = sidebar_state['time_range']
     
-    # Get current price if needed
+    # Start whichever API requests are needed concurrently (the workers never touch session state)
+    time_params = get_time_range_params(time_range)
+    cache_key = time_range  # Use only the time range selection as cache key
+    current_price_future = None
+    historical_future = None
     if should_fetch_current_price(auto_refresh_enabled):
-        current_price_data = get_current_price_from_api()
+        current_price_future = _fetch_executor.submit(get_current_price_from_api)
+    if should_fetch_historical_data(cache_key):
+        historical_future = _fetch_executor.submit(get_price_data_from_db, time_params)
+    
+    # Get current price if needed
+    if current_price_future is not None:
+        current_price_data = current_price_future.result()
         update_current_price_cache(current_price_data)
     else:
         current_price_data = st.session_state.get('current_price')
@@ -68,18 +105,19 @@ def main():
         display_price_cards(current_price_data)
     
     # Get historical data with caching
-    time_params = get_time_range_params(time_range)
-    cache_key = time_range  # Use only the time range selection as cache key
-    if should_fetch_historical_data(cache_key):
-        df = get_price_data_from_db(time_params)
+    if historical_future is not None:
+        df = historical_future.result()
         update_historical_data_cache(df, cache_key)
     else:
         df = st.session_state.historical_data
     
     if not df.empty:
+        # Convert and downsample once; every chart builder shares the prepared frame
+        chart_df = get_chart_frame(df, selected_timezone)
+        
         # Combined price and volume chart
         st.plotly_chart(
-            create_combined_price_volume_chart(df, selected_timezone), 
+            create_combined_price_volume_chart(chart_df, selected_timezone), 
             use_container_width=True
         )
         
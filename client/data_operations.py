@@ -5,17 +5,41 @@ Handles data retrieval via API endpoints using dependency injection
 
 import sys
 import os
+import threading
+import time
+import numpy as np
+import orjson
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from typing import Optional, Dict, Any
 
 # Add the project root to Python path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from core.config import DEFAULT_DB_QUERY_LIMIT, FASTAPI_URL
 
+# Shared HTTP session - keeps connections to the FastAPI backend alive across reruns
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+))
+_session.headers.update({"Accept-Encoding": "gzip"})
+
+# Reruns triggered by widgets inside this window reuse the last current-price response
+_CURRENT_PRICE_TTL = 2.0  # seconds
+_current_price_cache = {'fetched_at': 0.0, 'data': None}
+_current_price_lock = threading.Lock()
+
+# History fields the dashboard actually uses; anything else (id, market_cap) is dropped on arrival
+_HISTORY_COLUMNS = ('timestamp', 'price', 'volume_24h')
+
 
 def get_price_data_from_db(time_params=None) -> pd.DataFrame:
     """Get price data via API endpoint (DIP compliant) with optional time filtering"""
@@ -29,15 +53,26 @@ def get_price_data_from_db(time_params=None) -> pd.DataFrame:
             api_url = f"{FASTAPI_URL}/price/history"
             params = {"limit": DEFAULT_DB_QUERY_LIMIT}
             
-        response = requests.get(api_url, params=params, timeout=10)
+        response = _session.get(api_url, params=params, timeout=10)
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             if data:
-                df = pd.DataFrame(data)
+                # Pivot the row records into columns; building the frame column-wise is much cheaper,
+                # and only the fields the charts use are kept in session state
+                columns = {key: [row[key] for row in data] for key in _HISTORY_COLUMNS if key in data[0]}
+                df = pd.DataFrame(columns)
                 # Convert timestamp strings to datetime objects
                 if 'timestamp' in df.columns:
-                    df['timestamp'] = pd.to_datetime(df['timestamp'])
+                    df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601')
+                    # Keep timestamps as naive UTC datetime64 (plain int64 underneath); the display
+                    # timezone travels separately and is only applied when charts are built
+                    if isinstance(df['timestamp'].dtype, pd.DatetimeTZDtype):
+                        df['timestamp'] = df['timestamp'].dt.tz_convert('UTC').dt.tz_localize(None)
+                # Volume is only charted, so single precision is plenty; price stays float64
+                # because it is displayed to the cent
+                if 'volume_24h' in df.columns:
+                    df['volume_24h'] = pd.to_numeric(df['volume_24h']).astype(np.float32)
                 return df
         return pd.DataFrame()
         
@@ -47,20 +82,29 @@ def get_price_data_from_db(time_params=None) -> pd.DataFrame:
 
 
 def get_current_price_from_api() -> Optional[Dict[str, Any]]:
-    """Fetch current price via API endpoint (DIP compliant)"""
+    """Fetch current price via API endpoint (DIP compliant), reusing a response younger than _CURRENT_PRICE_TTL"""
+    with _current_price_lock:
+        if _current_price_cache['data'] is not None and time.monotonic() - _current_price_cache['fetched_at'] < _CURRENT_PRICE_TTL:
+            return _current_price_cache['data']
+    
     try:
         api_url = f"{FASTAPI_URL}/price/current"
-        response = requests.get(api_url, timeout=10)
+        response = _session.get(api_url, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
             # Convert to expected format
-            return {
+            price_data = {
                 'price': data['price'],
                 'timestamp': datetime.fromisoformat(data['timestamp'].replace('Z', '+00:00')),
                 'volume_24h': data.get('volume_24h'),
                 'market_cap': data.get('market_cap')
             }
+            # Only successful responses are cached, so a failed call is retried on the next rerun
+            with _current_price_lock:
+                _current_price_cache['fetched_at'] = time.monotonic()
+                _current_price_cache['data'] = price_data
+            return price_data
         return None
         
     except Exception as e:
@@ -72,7 +116,7 @@ def clear_all_data() -> bool:
     """Clear all data via API endpoint (DIP compliant)"""
     try:
         api_url = f"{FASTAPI_URL}/data/clear"
-        response = requests.delete(api_url, timeout=10)
+        response = _session.delete(api_url, timeout=10)
         return response.status_code == 200
     except Exception as e:
         print(f"Error clearing data: {e}")
@@ -83,7 +127,7 @@ def shutdown_application() -> bool:
     """Shutdown application via API endpoint (DIP compliant)"""
     try:
         api_url = f"{FASTAPI_URL}/system/shutdown"
-        response = requests.post(api_url, timeout=5)
+        response = _session.post(api_url, timeout=5)
         return response.status_code == 200
     except requests.exceptions.Timeout:
         # Connection timeout is expected during shutdown
@@ -97,7 +141,7 @@ def get_statistics() -> Optional[Dict[str, Any]]:
     """Get price statistics via API endpoint (DIP compliant)"""
     try:
         api_url = f"{FASTAPI_URL}/stats"
-        response = requests.get(api_url, timeout=10)
+        response = _session.get(api_url, timeout=10)
         
         if response.status_code == 200:
             return response.json()
@@ -112,7 +156,7 @@ def trigger_price_collection() -> bool:
     """Trigger manual price collection via API endpoint (DIP compliant)"""
     try:
         api_url = f"{FASTAPI_URL}/price/collect"
-        response = requests.post(api_url, timeout=10)
+        response = _session.post(api_url, timeout=10)
         return response.status_code == 200
     except Exception as e:
         print(f"Error triggering price collection: {e}")
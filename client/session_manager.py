@@ -7,12 +7,15 @@ import sys
 import os
 import streamlit as st
 import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 # Add the project root to Python path BEFORE any imports
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
-from core.config import APP_TITLE, APP_ICON, get_user_parameter, AUTO_REFRESH_INTERVAL
+from core.config import APP_TITLE, APP_ICON, get_user_parameter, AUTO_REFRESH_INTERVAL, AUTO_REFRESH_COUNTDOWN_TICK, TIME_RANGE_OPTIONS
 from core.timezone_utils import get_default_timezone
 
 
@@ -25,46 +28,36 @@ def initialize_page_config():
     )
 
 
+def _default_time_range():
+    """Initial time range: the user's saved selection, or the first option if the default is unavailable"""
+    default_time_range = "Last 7 days"
+    # Ensure the default exists in our options
+    if default_time_range in TIME_RANGE_OPTIONS:
+        return get_user_parameter('time_range_selection', default_time_range)
+    # Fallback to first available option
+    return next(iter(TIME_RANGE_OPTIONS))
+
+
+# Session state defaults as lazy factories, applied in order (time range FIRST to prevent widget
+# conflicts, since the widget-specific key is seeded from it)
+_SESSION_DEFAULTS = {
+    'time_range': _default_time_range,
+    'time_range_select': lambda: st.session_state.time_range,
+    'auto_refresh': lambda: get_user_parameter('auto_refresh_enabled', True),  # default to True for better UX
+    'selected_timezone': lambda: get_user_parameter('selected_timezone', get_default_timezone()),
+    'last_refresh': time.monotonic,
+    'current_price': lambda: None,
+    'historical_data': lambda: None,
+    'next_data_fetch': lambda: 0.0,  # time.monotonic() deadline for the next history fetch
+}
+
+
 def initialize_session_state():
     """Initialize session state with USER_PARAMETERS defaults"""
-    # Initialize time range FIRST to prevent widget conflicts
-    if 'time_range' not in st.session_state:
-        from core.config import TIME_RANGE_OPTIONS
-        default_time_range = "Last 7 days"
-        # Ensure the default exists in our options
-        if default_time_range in TIME_RANGE_OPTIONS:
-            st.session_state.time_range = get_user_parameter('time_range_selection', default_time_range)
-        else:
-            # Fallback to first available option
-            st.session_state.time_range = list(TIME_RANGE_OPTIONS.keys())[0]
-    
-    # Also initialize the widget-specific key
-    if 'time_range_select' not in st.session_state:
-        st.session_state.time_range_select = st.session_state.time_range
-    
-    # Auto refresh settings (default to True for better UX)
-    if 'auto_refresh' not in st.session_state:
-        st.session_state.auto_refresh = get_user_parameter('auto_refresh_enabled', True)
-    
-    # Timezone settings
-    if 'selected_timezone' not in st.session_state:
-        st.session_state.selected_timezone = get_user_parameter('selected_timezone', get_default_timezone())
-    
-    # Refresh timing
-    if 'last_refresh' not in st.session_state:
-        st.session_state.last_refresh = time.time()
-    
-    # Current price cache
-    if 'current_price' not in st.session_state:
-        st.session_state.current_price = None
-    
-    # Historical data cache
-    if 'historical_data' not in st.session_state:
-        st.session_state.historical_data = None
-    
-    # Last data fetch time
-    if 'last_data_fetch' not in st.session_state:
-        st.session_state.last_data_fetch = 0
+    # One membership check per key; factories only run for keys that are still missing
+    for key, make_default in _SESSION_DEFAULTS.items():
+        if key not in st.session_state:
+            st.session_state[key] = make_default()
 
 
 def should_fetch_current_price(auto_refresh_enabled):
@@ -72,7 +65,7 @@ def should_fetch_current_price(auto_refresh_enabled):
     return (
         'current_price' not in st.session_state or
         st.session_state.current_price is None or
-        (auto_refresh_enabled and time.time() - st.session_state.last_refresh >= AUTO_REFRESH_INTERVAL)
+        (auto_refresh_enabled and time.monotonic() - st.session_state.last_refresh >= AUTO_REFRESH_INTERVAL)
     )
 
 
@@ -86,52 +79,59 @@ def should_fetch_historical_data(cache_key):
     """Determine if historical data should be fetched based on cache key"""
     return (
         st.session_state.historical_data is None or
-        time.time() - st.session_state.last_data_fetch >= AUTO_REFRESH_INTERVAL or
-        getattr(st.session_state, 'last_cache_key', None) != cache_key  # Refetch if time range changed
+        time.monotonic() >= st.session_state.next_data_fetch or
+        st.session_state.get('last_cache_key') != cache_key  # Refetch if time range changed
     )
 
 
 def update_historical_data_cache(df, cache_key=None):
     """Update the historical data in session state cache"""
     if df is not None and not df.empty:
-        st.session_state.historical_data = df
-        st.session_state.last_data_fetch = time.time()
+        # Keep the cached frame object when a refetch returned the same rows, so everything
+        # keyed on it downstream stays warm; the next fetch is rescheduled either way
+        fingerprint = (len(df), df['timestamp'].iat[0], df['timestamp'].iat[-1]) if 'timestamp' in df.columns else None
+        if fingerprint is None or fingerprint != st.session_state.get('historical_fingerprint'):
+            st.session_state.historical_data = df
+            st.session_state.historical_fingerprint = fingerprint
+        st.session_state.next_data_fetch = time.monotonic() + AUTO_REFRESH_INTERVAL
         if cache_key:
             st.session_state.last_cache_key = cache_key
 
 
+@st.fragment(run_every=AUTO_REFRESH_COUNTDOWN_TICK)
+def _auto_refresh_countdown():
+    """Tick the sidebar countdown every few seconds, rerunning the whole app only when a refresh is due"""
+    time_since_last = time.monotonic() - st.session_state.last_refresh
+    if time_since_last >= AUTO_REFRESH_INTERVAL:
+        st.rerun(scope="app")
+    
+    time_remaining = AUTO_REFRESH_INTERVAL - time_since_last
+    st.info(f"Auto-refresh in: {int(time_remaining)} seconds")
+
+
 def handle_auto_refresh(auto_refresh_enabled):
     """Handle auto-refresh logic with proper timing"""
     if auto_refresh_enabled:
-        current_time = time.time()
-        time_since_last = current_time - st.session_state.last_refresh
-        
-        if time_since_last >= AUTO_REFRESH_INTERVAL:
+        # This pass already refetched anything that was due, so restart the interval
+        current_time = time.monotonic()
+        if current_time - st.session_state.last_refresh >= AUTO_REFRESH_INTERVAL:
             st.session_state.last_refresh = current_time
-            st.rerun()
-        else:
-            # Show countdown to next refresh
-            time_remaining = AUTO_REFRESH_INTERVAL - time_since_last
-            st.sidebar.info(f"Auto-refresh in: {int(time_remaining)} seconds")
-            
-            # Use Streamlit's automatic rerun mechanism with timer
-            # Schedule a rerun when the time is up
-            time.sleep(1)  # Small delay to update the countdown
-            st.rerun()
+        
+        # Only the countdown fragment reruns between refreshes; the script never sleeps
+        with st.sidebar:
+            _auto_refresh_countdown()
 
 
-def get_time_range_params(time_range):
-    """Convert time range selection to API parameters"""
-    from core.config import TIME_RANGE_OPTIONS
-    from datetime import datetime, timedelta
-    
+@lru_cache(maxsize=32)
+def _time_range_params(time_range, minute_bucket):
+    """Build the API time window for a range selection ending at the given minute (naive UTC)"""
     time_config = TIME_RANGE_OPTIONS.get(time_range)
     
     if time_config is None:  # "All data"
         return None
     
     # Calculate timestamp for the time range
-    now = datetime.utcnow()
+    now = datetime.fromtimestamp(minute_bucket * 60, timezone.utc).replace(tzinfo=None)
     if 'hours' in time_config:
         start_time = now - timedelta(hours=time_config['hours'])
     elif 'days' in time_config:
@@ -142,4 +142,13 @@ def get_time_range_params(time_range):
     return {
         'start_time': start_time.isoformat(),
         'end_time': now.isoformat()
-    }
\ No newline at end of file
+    }
+
+
+def get_time_range_params(time_range):
+    """Convert time range selection to API parameters"""
+    # Round the window end up to the next whole minute so reruns within a minute reuse the
+    # same params while still covering the newest data point
+    minute_bucket = int(time.time() // 60) + 1
+    params = _time_range_params(time_range, minute_bucket)
+    return dict(params) if params is not None else None
\ No newline at end of file
@@ -7,32 +7,65 @@ import sys
 import os
 import streamlit as st
 import time
+from functools import lru_cache
 
 # Add the project root and client folder to Python path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 client_root = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, project_root)
-sys.path.insert(0, client_root)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+if client_root not in sys.path:
+    sys.path.insert(0, client_root)
 
 from core.config import (
     GUI_HEADERS, BUTTON_LABELS, BUTTON_HELP, UI_MESSAGES, 
     GUI_REFRESH_LABEL, TIME_RANGE_OPTIONS,
-    get_user_parameter, set_user_parameter, get_all_user_parameters
+    get_user_parameter, set_user_parameter, get_all_user_parameters, reset_user_parameters
 )
 from core.timezone_utils import get_available_timezones, set_default_timezone
 from data_operations import clear_all_data
 
 
+# Sidebar text resolved once at import rather than looked up on every rerun
+_HEADER_CONTROLS = GUI_HEADERS['controls']
+_HEADER_TIMEZONE = GUI_HEADERS['timezone_settings']
+_HEADER_DATA = GUI_HEADERS['data_settings']
+_LABEL_REFRESH_NOW = BUTTON_LABELS['refresh_now']
+_LABEL_CLEAR_DATA = BUTTON_LABELS['clear_data']
+_MSG_DATA_CLEARED = UI_MESSAGES['data_cleared_success']
+_MSG_CLEAR_FAILED = UI_MESSAGES['failed_clear_data']
+
+# Position of each selectable timezone, so the selector's initial index is a dict lookup
+_TIMEZONE_INDEX = {tz_name: index for index, tz_name in enumerate(get_available_timezones())}
+
+# (label, user parameter, default, formatter) rows shown in the settings panel
+_KEY_SETTINGS = (
+    ('Auto Refresh', 'auto_refresh_enabled', False, lambda v: "✅ Enabled" if v else "❌ Disabled"),
+    ('Refresh Interval', 'auto_refresh_interval', 60, "{}s".format),
+    ('Timezone', 'selected_timezone', 'UTC', str),
+    ('Time Range', 'time_range_selection', 'Last 7 days', str),
+    ('Collection Interval', 'collection_interval', 60, "{}s".format),
+    ('API Timeout', 'api_request_timeout', 10, "{}s".format),
+    ('Rate Limit Interval', 'rate_limit_interval', 15, "{}s".format),
+)
+
+
+@lru_cache(maxsize=1)
+def _time_range_option_keys():
+    """Time range labels for the selector, built once (cleared when settings are reset)"""
+    return tuple(get_user_parameter('time_range_options', TIME_RANGE_OPTIONS).keys())
+
+
 def render_control_buttons():
     """Render main control buttons"""
-    st.sidebar.header(GUI_HEADERS['controls'])
+    st.sidebar.header(_HEADER_CONTROLS)
     
     # Auto-refresh is now always enabled by default, no toggle needed
     auto_refresh = st.session_state.auto_refresh
     
     # Action buttons
-    refresh_button = st.sidebar.button(BUTTON_LABELS['refresh_now'])
-    clear_data_button = st.sidebar.button(BUTTON_LABELS['clear_data'], type="secondary")
+    refresh_button = st.sidebar.button(_LABEL_REFRESH_NOW)
+    clear_data_button = st.sidebar.button(_LABEL_CLEAR_DATA, type="secondary")
     
     return {
         'auto_refresh': auto_refresh,
@@ -43,13 +76,10 @@ def render_control_buttons():
 
 def render_timezone_selector():
     """Render timezone selection controls"""
-    st.sidebar.header(GUI_HEADERS['timezone_settings'])
+    st.sidebar.header(_HEADER_TIMEZONE)
     
     available_timezones = get_available_timezones()
-    try:
-        current_index = available_timezones.index(st.session_state.selected_timezone)
-    except ValueError:
-        current_index = 0
+    current_index = _TIMEZONE_INDEX.get(st.session_state.selected_timezone, 0)
     
     selected_timezone = st.sidebar.selectbox(
         "Select Timezone",
@@ -70,10 +100,10 @@ def render_timezone_selector():
 
 def render_data_settings():
     """Render data settings controls"""
-    st.sidebar.header(GUI_HEADERS['data_settings'])
+    st.sidebar.header(_HEADER_DATA)
     
     # Time range selector - session state should already be initialized
-    time_range_options = list(get_user_parameter('time_range_options', TIME_RANGE_OPTIONS).keys())
+    time_range_options = _time_range_option_keys()
     
     # The widget key should already be initialized in initialize_session_state()
     widget_key = "time_range_select"
@@ -90,31 +120,29 @@ def render_data_settings():
         st.session_state.time_range = time_range
         set_user_parameter('time_range_selection', time_range)
         # Clear cache to refresh data
-        if hasattr(st.session_state, 'last_data_fetch'):
-            st.session_state.last_data_fetch = 0
+        if 'next_data_fetch' in st.session_state:
+            st.session_state.next_data_fetch = 0.0
     
     return time_range
 
 
 def render_user_settings_panel():
     """Render user settings display panel"""
-    with st.sidebar.expander("🔧 Current Settings", expanded=False):
+    # Track the expander state so a collapsed panel skips building its contents on every rerun
+    settings_panel = st.sidebar.expander("🔧 Current Settings", expanded=False, key="settings_panel", on_change="rerun")
+    with settings_panel:
+        if not settings_panel.open:
+            return
+        
         st.write("**User Configuration:**")
         user_params = get_all_user_parameters()
         
-        # Display key user settings in a readable format
-        key_settings = {
-            'Auto Refresh': "✅ Enabled" if user_params.get('auto_refresh_enabled', False) else "❌ Disabled",
-            'Refresh Interval': f"{user_params.get('auto_refresh_interval', 60)}s",
-            'Timezone': user_params.get('selected_timezone', 'UTC'),
-            'Time Range': user_params.get('time_range_selection', 'Last 7 days'),
-            'Collection Interval': f"{user_params.get('collection_interval', 60)}s",
-            'API Timeout': f"{user_params.get('api_request_timeout', 10)}s",
-            'Rate Limit Interval': f"{user_params.get('rate_limit_interval', 15)}s",
-        }
-        
-        for key, value in key_settings.items():
-            st.write(f"• **{key}:** {value}")
+        # Display key user settings in a readable format, as a single markdown element
+        settings_lines = [
+            f"• **{label}:** {format_value(user_params.get(param, default))}"
+            for label, param, default, format_value in _KEY_SETTINGS
+        ]
+        st.markdown("  \n".join(settings_lines))
         
         st.markdown("---")
         
@@ -136,8 +164,8 @@ def render_user_settings_panel():
         
         with col2:
             if st.button("🔄 Reset to Defaults", help="Reset all settings to default values", type="secondary"):
-                from core.config import reset_user_parameters
                 reset_user_parameters()
+                _time_range_option_keys.cache_clear()
                 st.success("Settings reset to defaults!")
                 st.rerun()
 
@@ -149,19 +177,21 @@ def handle_button_actions(controls):
         'data_cleared': False
     }
     
-    # Handle manual refresh
+    # Handle manual refresh - the button click already started this run, so rather than queueing
+    # a second one, mark the cached data stale and let the rest of this pass refetch it
     if controls['refresh_button']:
-        st.session_state.last_refresh = time.time()
+        st.session_state.last_refresh = time.monotonic()
+        st.session_state.current_price = None
+        st.session_state.next_data_fetch = 0.0
         actions['refresh_requested'] = True
-        st.rerun()
     
     # Handle clear data
     if controls['clear_data_button']:
         if clear_all_data():
-            st.sidebar.success(UI_MESSAGES['data_cleared_success'])
+            st.sidebar.success(_MSG_DATA_CLEARED)
             actions['data_cleared'] = True
         else:
-            st.sidebar.error(UI_MESSAGES['failed_clear_data'])
+            st.sidebar.error(_MSG_CLEAR_FAILED)
     
     return actions
 
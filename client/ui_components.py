@@ -7,18 +7,38 @@ import sys
 import os
 import streamlit as st
 import pandas as pd
-import pytz
+from zoneinfo import ZoneInfo
+from pandas.api.types import is_datetime64_any_dtype
 
 # Add the project root to Python path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from core.config import COLORS, CSS_SIZES, METRIC_LABELS, CHART_LABELS, RECENT_ENTRIES_DISPLAY_LIMIT
 
-
-def apply_custom_css():
-    """Apply custom CSS styling"""
-    st.markdown("""
+# Labels resolved once at import rather than looked up on every rerun
+_LABEL_CURRENT_PRICE = METRIC_LABELS['current_price']
+_LABEL_MARKET_CAP = METRIC_LABELS['market_cap']
+_LABEL_VOLUME_24H = METRIC_LABELS['volume_24h']
+_LABEL_DATA_POINTS = METRIC_LABELS['data_points']
+_LABEL_AVERAGE_PRICE = METRIC_LABELS['average_price']
+_LABEL_MIN_PRICE = METRIC_LABELS['min_price']
+_LABEL_MAX_PRICE = METRIC_LABELS['max_price']
+_RECENT_DATA_TITLE_FMT = CHART_LABELS['recent_data_title']
+_MAIN_HEADER_HTML = f'<div class="main-header">{CHART_LABELS["main_title"]}</div>'
+_FOOTER_MD = (
+    "---\n\n"
+    "**Data Source:** CoinGecko API | **Collection Rate:** 60 seconds | **Auto-refresh:** 60 seconds (when enabled)"
+)
+
+# Price column of the recent data table, rendered like "$1,234.57"
+_PRICE_COLUMN = st.column_config.NumberColumn("Price", format="dollar")
+
+
+# Static markup, built once at import; the CSS must still be emitted on every rerun because
+# Streamlit drops any element a run does not re-render
+_CUSTOM_CSS = """
     <style>
         .main-header {
             font-size: 3rem;
@@ -42,7 +62,19 @@ def apply_custom_css():
             margin: 5px 0;
         }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+_PRICE_CARD_TEMPLATE = """
+        <div class="price-card">
+            <h2>{value}</h2>
+            <p>{label}</p>
+        </div>
+        """
+
+
+def apply_custom_css():
+    """Apply custom CSS styling"""
+    st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
 
 
 
@@ -54,72 +86,71 @@ def display_price_cards(current_price_data):
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.markdown(f"""
-        <div class="price-card">
-            <h2>${current_price_data['price']:,.2f}</h2>
-            <p>{METRIC_LABELS['current_price']}</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_PRICE_CARD_TEMPLATE.format(
+            value=f"${current_price_data['price']:,.2f}",
+            label=_LABEL_CURRENT_PRICE
+        ), unsafe_allow_html=True)
     
     with col2:
         if current_price_data.get('market_cap'):
-            st.markdown(f"""
-            <div class="price-card">
-                <h2>${current_price_data['market_cap']:,.0f}</h2>
-                <p>{METRIC_LABELS['market_cap']}</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_PRICE_CARD_TEMPLATE.format(
+                value=f"${current_price_data['market_cap']:,.0f}",
+                label=_LABEL_MARKET_CAP
+            ), unsafe_allow_html=True)
     
     with col3:
         if current_price_data.get('volume_24h'):
-            st.markdown(f"""
-            <div class="price-card">
-                <h2>${current_price_data['volume_24h']:,.0f}</h2>
-                <p>{METRIC_LABELS['volume_24h']}</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_PRICE_CARD_TEMPLATE.format(
+                value=f"${current_price_data['volume_24h']:,.0f}",
+                label=_LABEL_VOLUME_24H
+            ), unsafe_allow_html=True)
 
 
 def display_statistics_metrics(stats):
     """Display statistics in metric format"""
-    col1, col2, col3, col4 = st.columns(4)
+    metrics = (
+        (_LABEL_DATA_POINTS, stats['data_points']),
+        (_LABEL_AVERAGE_PRICE, f"${stats['average_price']:,.2f}"),
+        (_LABEL_MIN_PRICE, f"${stats['min_price']:,.2f}"),
+        (_LABEL_MAX_PRICE, f"${stats['max_price']:,.2f}"),
+    )
     
-    with col1:
-        st.metric(METRIC_LABELS['data_points'], stats['data_points'])
-    with col2:
-        st.metric(METRIC_LABELS['average_price'], f"${stats['average_price']:,.2f}")
-    with col3:
-        st.metric(METRIC_LABELS['min_price'], f"${stats['min_price']:,.2f}")
-    with col4:
-        st.metric(METRIC_LABELS['max_price'], f"${stats['max_price']:,.2f}")
+    # Write straight into each column rather than entering it as a context
+    for column, (label, value) in zip(st.columns(len(metrics)), metrics):
+        column.metric(label, value)
 
 
 def display_recent_data_table(df, selected_timezone):
     """Display recent data table with timezone conversion"""
-    st.subheader(CHART_LABELS['recent_data_title'].format(timezone=selected_timezone))
+    st.subheader(_RECENT_DATA_TITLE_FMT.format(timezone=selected_timezone))
     
-    # Convert timestamps to local timezone for display
-    recent_df = df.tail(RECENT_ENTRIES_DISPLAY_LIMIT).copy()
+    # Convert timestamps to local timezone for display (the tail is only read, never mutated)
+    recent_df = df.tail(RECENT_ENTRIES_DISPLAY_LIMIT)
+    timestamps = recent_df['timestamp']
     
     if selected_timezone != 'UTC':
         try:
-            # First ensure timestamps are timezone-aware (assume UTC if naive)
-            recent_df['timestamp'] = pd.to_datetime(recent_df['timestamp'], utc=True)
+            # First ensure timestamps are timezone-aware (assume UTC if naive), parsing only
+            # when the column is not already datetime64
+            if not is_datetime64_any_dtype(timestamps):
+                timestamps = pd.to_datetime(timestamps, utc=True, format='ISO8601')
+            elif timestamps.dt.tz is None:
+                timestamps = timestamps.dt.tz_localize('UTC')
             # Then convert to selected timezone
-            target_tz = pytz.timezone(selected_timezone)
-            recent_df['timestamp'] = recent_df['timestamp'].dt.tz_convert(target_tz)
+            timestamps = timestamps.dt.tz_convert(ZoneInfo(selected_timezone))
         except Exception as e:
             print(f"Timezone conversion error for table: {e}")
             # Keep original timestamps if conversion fails
             pass
     
-    # Format for display
-    recent_df['Price'] = recent_df['price'].apply(lambda x: f"${x:,.2f}")
-    recent_df['Timestamp'] = recent_df['timestamp']
-    
-    # Display only the relevant columns
-    display_df = recent_df[['Timestamp', 'Price']].copy()
-    st.dataframe(display_df.iloc[::-1], use_container_width=True)
+    # Display only the relevant columns, newest first; prices stay numeric and are formatted
+    # as dollars by the frontend instead of per-row Python string formatting
+    display_df = pd.DataFrame({'Timestamp': timestamps, 'Price': recent_df['price']})
+    st.dataframe(
+        display_df.iloc[::-1],
+        use_container_width=True,
+        column_config={'Price': _PRICE_COLUMN}
+    )
 
 
 def display_no_data_message():
@@ -130,10 +161,9 @@ def display_no_data_message():
 
 def display_footer():
     """Display footer information"""
-    st.markdown("---")
-    st.markdown("**Data Source:** CoinGecko API | **Collection Rate:** 60 seconds | **Auto-refresh:** 60 seconds (when enabled)")
+    st.markdown(_FOOTER_MD)
 
 
 def show_main_header():
     """Display the main application header"""
-    st.markdown(f'<div class="main-header">{CHART_LABELS["main_title"]}</div>', unsafe_allow_html=True)
\ No newline at end of file
+    st.markdown(_MAIN_HEADER_HTML, unsafe_allow_html=True)
\ No newline at end of file
@@ -24,6 +24,7 @@ SCHEDULER_SLEEP_INTERVAL = 1  # seconds to sleep in scheduler loop
 # GUI Configuration
 AUTO_REFRESH_INTERVAL = 60  # seconds between GUI auto-refreshes
 AUTO_REFRESH_MAX_SLEEP = 5  # maximum seconds to sleep during refresh countdown
+AUTO_REFRESH_COUNTDOWN_TICK = max(AUTO_REFRESH_INTERVAL // 10, 5)  # seconds between countdown updates
 GUI_REFRESH_LABEL = f"Auto Refresh ({AUTO_REFRESH_INTERVAL}s)"
 
 # Data Limits
@@ -32,6 +33,7 @@ DEFAULT_API_LIMIT = 100
 DEFAULT_SERIES_LIMIT = 50
 RECENT_ENTRIES_DISPLAY_LIMIT = 10
 RECENT_DATA_TAIL_LIMIT = 10
+SHARED_DATA_CAPACITY = 10000  # most recent prices kept in memory by the shared data store
 
 # Time Ranges for GUI (now using time periods instead of point counts)
 TIME_RANGE_OPTIONS = {
@@ -17,6 +17,7 @@ DATABASE_URL = f"sqlite:///./{DATABASE_FOLDER}/{DATABASE_NAME}"
 FASTAPI_HOST = "0.0.0.0"
 FASTAPI_PORT = 8000
 STREAMLIT_PORT = 8501
+GZIP_MINIMUM_SIZE = 1000  # bytes; smaller API responses are sent uncompressed
 
 # Local Server URLs
 FASTAPI_URL = f"http://localhost:{FASTAPI_PORT}"
@@ -3,9 +3,11 @@ Logging configuration for the application
 Sets up comprehensive file and console logging
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from datetime import datetime
 from pathlib import Path
 
@@ -23,6 +25,33 @@ DEBUG_LOG_FILE = LOGS_DIR / "debug.log"
 # Log format
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+_FORMATTER = logging.Formatter(LOG_FORMAT, DATE_FORMAT)  # formatters are stateless, so every handler shares one
+
+# Background listeners that own the real file/console handlers, keyed by logger (or group) name
+_listeners = {}
+
+
+def _stop_listeners():
+    """Flush and stop every queue listener (registered to run at interpreter exit)"""
+    for listener in _listeners.values():
+        listener.stop()
+    _listeners.clear()
+
+
+atexit.register(_stop_listeners)
+
+
+def _start_queue_listener(key: str, *handlers: logging.Handler) -> logging.handlers.QueueHandler:
+    """Move handlers onto a background listener thread and return the QueueHandler that feeds it"""
+    previous = _listeners.pop(key, None)
+    if previous is not None:
+        previous.stop()
+    
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners[key] = listener
+    return logging.handlers.QueueHandler(log_queue)
 
 
 def setup_file_logger(name: str, log_file: Path, level: int = logging.INFO) -> logging.Logger:
@@ -31,8 +60,7 @@ def setup_file_logger(name: str, log_file: Path, level: int = logging.INFO) -> l
     logger.setLevel(level)
     
     # Remove existing handlers to avoid duplicates
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
+    logger.handlers.clear()
     
     # File handler with rotation
     file_handler = logging.handlers.RotatingFileHandler(
@@ -41,17 +69,15 @@ def setup_file_logger(name: str, log_file: Path, level: int = logging.INFO) -> l
         backupCount=5
     )
     file_handler.setLevel(level)
-    file_formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
-    file_handler.setFormatter(file_formatter)
+    file_handler.setFormatter(_FORMATTER)
     
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(level)
-    console_formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
-    console_handler.setFormatter(console_formatter)
+    console_handler.setFormatter(_FORMATTER)
     
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Callers only enqueue records; disk and console writes happen on the listener thread
+    logger.addHandler(_start_queue_listener(name, file_handler, console_handler))
     
     return logger
 
@@ -70,12 +96,12 @@ def setup_api_logging():
         backupCount=5
     )
     api_file_handler.setLevel(logging.INFO)
-    api_formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
-    api_file_handler.setFormatter(api_formatter)
+    api_file_handler.setFormatter(_FORMATTER)
     
-    # Add file handlers to API loggers
+    # Add file handlers to API loggers (all three share one queue and listener)
+    api_queue_handler = _start_queue_listener("api", api_file_handler)
     for logger in [uvicorn_logger, uvicorn_access_logger, fastapi_logger]:
-        logger.addHandler(api_file_handler)
+        logger.addHandler(api_queue_handler)
 
 
 def setup_application_logging():
@@ -1,7 +1,9 @@
 from datetime import datetime, timezone
+from functools import lru_cache
 import pytz
-import locale
-import os
+
+_UTC = timezone.utc
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S %Z'
 
 # Default timezone - you can change this to your local timezone
 DEFAULT_TIMEZONE = 'UTC'  # Change this to your timezone like 'US/Eastern', 'Europe/London', 'Asia/Tokyo', etc.
@@ -17,31 +19,33 @@ def _initialize_user_parameters_timezone():
         # Ignore if config is not available during initial setup
         pass
 
+# Common timezones offered in the GUI, sorted once at import
+AVAILABLE_TIMEZONES = tuple(sorted([
+    'UTC',
+    'US/Eastern',
+    'US/Central', 
+    'US/Mountain',
+    'US/Pacific',
+    'Europe/London',
+    'Europe/Paris',
+    'Europe/Berlin',
+    'Europe/Rome',
+    'Asia/Tokyo',
+    'Asia/Shanghai',
+    'Asia/Kolkata',
+    'Asia/Jerusalem',
+    'Australia/Sydney',
+    'America/New_York',
+    'America/Chicago',
+    'America/Denver',
+    'America/Los_Angeles',
+    'America/Toronto',
+    'America/Sao_Paulo',
+]))
+
 def get_available_timezones():
-    """Get list of common timezones"""
-    common_timezones = [
-        'UTC',
-        'US/Eastern',
-        'US/Central', 
-        'US/Mountain',
-        'US/Pacific',
-        'Europe/London',
-        'Europe/Paris',
-        'Europe/Berlin',
-        'Europe/Rome',
-        'Asia/Tokyo',
-        'Asia/Shanghai',
-        'Asia/Kolkata',
-        'Asia/Jerusalem',
-        'Australia/Sydney',
-        'America/New_York',
-        'America/Chicago',
-        'America/Denver',
-        'America/Los_Angeles',
-        'America/Toronto',
-        'America/Sao_Paulo',
-    ]
-    return sorted(common_timezones)
+    """Get list of common timezones (an immutable tuple, so no defensive copy is needed)"""
+    return AVAILABLE_TIMEZONES
 
 def get_system_timezone():
     """Get the system's local timezone"""
@@ -52,6 +56,11 @@ def get_system_timezone():
         # Fallback to UTC if detection fails
         return 'UTC'
 
+@lru_cache(maxsize=64)
+def _get_tz(tz_name):
+    """Resolve a timezone name once; pytz tzinfo objects are immutable and safe to share"""
+    return pytz.timezone(tz_name)
+
 def convert_utc_to_local(utc_datetime, target_timezone=None):
     """Convert UTC datetime to local timezone"""
     if target_timezone is None:
@@ -59,37 +68,53 @@ def convert_utc_to_local(utc_datetime, target_timezone=None):
     
     # If the datetime is naive (no timezone info), assume it's UTC
     if utc_datetime.tzinfo is None:
-        utc_datetime = utc_datetime.replace(tzinfo=timezone.utc)
+        utc_datetime = utc_datetime.replace(tzinfo=_UTC)
     
     # Convert to target timezone
     if target_timezone == 'UTC':
         return utc_datetime
     
+    # Already expressed in the target zone (pytz tzinfos carry their zone name)
+    if getattr(utc_datetime.tzinfo, 'zone', None) == target_timezone:
+        return utc_datetime
+    
     try:
-        target_tz = pytz.timezone(target_timezone)
+        target_tz = _get_tz(target_timezone)
         return utc_datetime.astimezone(target_tz)
     except:
         # Fallback to UTC if timezone is invalid
         return utc_datetime
 
-def format_datetime_local(dt, target_timezone=None, format_string=None):
+def format_datetime_local(dt, target_timezone=None, format_string=DATETIME_FORMAT):
     """Format datetime in local timezone"""
-    if format_string is None:
-        format_string = '%Y-%m-%d %H:%M:%S %Z'
-    
     local_dt = convert_utc_to_local(dt, target_timezone)
     return local_dt.strftime(format_string)
 
+def format_datetimes_local(timestamps, target_timezone=None, format_string=DATETIME_FORMAT):
+    """Format a whole DatetimeIndex in local timezone with one vectorized conversion (naive means UTC)"""
+    if target_timezone is None:
+        target_timezone = DEFAULT_TIMEZONE
+    
+    if timestamps.tz is None:
+        timestamps = timestamps.tz_localize(_UTC)
+    
+    try:
+        timestamps = timestamps.tz_convert(_get_tz(target_timezone))
+    except:
+        # Fallback to UTC if timezone is invalid
+        pass
+    return timestamps.strftime(format_string)
+
 def get_current_time_local(target_timezone=None):
     """Get current time in specified timezone"""
-    utc_now = datetime.now(timezone.utc)
+    utc_now = datetime.now(_UTC)
     return convert_utc_to_local(utc_now, target_timezone)
 
 # Configuration functions
 def set_default_timezone(tz_name):
     """Set the default timezone for the application"""
     global DEFAULT_TIMEZONE
-    if tz_name in pytz.all_timezones:
+    if tz_name in pytz.all_timezones_set:
         DEFAULT_TIMEZONE = tz_name
         return True
     return False
@@ -43,7 +43,8 @@ CHART_CONFIG = {
     'background_color': 'white',
     'hover_mode': 'x unified',
     'tick_format_currency': '$,.0f',
-    'tick_format_price': '$,.2f'
+    'tick_format_price': '$,.2f',
+    'max_points': 3000  # upper bound on points sent to the browser per trace
 }
 
 # Messages and Labels
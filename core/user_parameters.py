@@ -3,6 +3,8 @@ User parameter management
 Handles user-configurable settings and preferences
 """
 
+from types import MappingProxyType
+
 from .app_config import DEFAULT_TIMEZONE, API_REQUEST_TIMEOUT
 from .api_config import (
     AUTO_REFRESH_INTERVAL, DEFAULT_COLLECTION_INTERVAL, DEFAULT_DB_QUERY_LIMIT,
@@ -12,9 +14,8 @@ from .api_config import (
 )
 from .app_config import FASTAPI_HOST, FASTAPI_PORT, STREAMLIT_PORT
 
-# User-Configurable Parameters Collection
-# This dictionary contains all parameters that users can modify, with their default values
-USER_PARAMETERS = {
+# Default values for all user-configurable parameters
+_DEFAULT_USER_PARAMETERS = {
     # GUI Settings
     'auto_refresh_enabled': True,  # Default to enabled for better UX
     'auto_refresh_interval': AUTO_REFRESH_INTERVAL,
@@ -46,6 +47,17 @@ USER_PARAMETERS = {
     'time_range_options': TIME_RANGE_OPTIONS,
 }
 
+# Defaults restored by reset_user_parameters (timezone_options is populated once by
+# timezone_utils and is not a user setting, so a reset leaves it alone)
+_RESET_DEFAULTS = {key: value for key, value in _DEFAULT_USER_PARAMETERS.items() if key != 'timezone_options'}
+
+# User-Configurable Parameters Collection
+# This dictionary contains all parameters that users can modify, starting from the defaults
+USER_PARAMETERS = dict(_DEFAULT_USER_PARAMETERS)
+
+# Shared read-only view handed to readers instead of a fresh copy per call
+_USER_PARAMETERS_VIEW = MappingProxyType(USER_PARAMETERS)
+
 # User Parameter Management Functions
 def get_user_parameter(key: str, default=None):
     """Get a user parameter value, falling back to default if not found"""
@@ -59,7 +71,11 @@ def set_user_parameter(key: str, value):
     return False
 
 def get_all_user_parameters():
-    """Get a copy of all user parameters"""
+    """Get a read-only live view of all user parameters"""
+    return _USER_PARAMETERS_VIEW
+
+def snapshot_user_parameters():
+    """Get a copy of all user parameters (for callers that keep or serialize the result)"""
     return USER_PARAMETERS.copy()
 
 def update_user_parameters(updates: dict):
@@ -70,22 +86,4 @@ def update_user_parameters(updates: dict):
 
 def reset_user_parameters():
     """Reset all user parameters to their default values"""
-    USER_PARAMETERS.update({
-        'auto_refresh_enabled': False,
-        'auto_refresh_interval': AUTO_REFRESH_INTERVAL,
-        'selected_timezone': DEFAULT_TIMEZONE,
-        'time_range_selection': "Last 7 days",
-        'collection_interval': DEFAULT_COLLECTION_INTERVAL,
-        'api_request_timeout': API_REQUEST_TIMEOUT,
-        'db_query_limit': DEFAULT_DB_QUERY_LIMIT,
-        'api_response_limit': DEFAULT_API_LIMIT,
-        'series_data_limit': DEFAULT_SERIES_LIMIT,
-        'recent_entries_display': RECENT_ENTRIES_DISPLAY_LIMIT,
-        'rate_limit_interval': RATE_LIMIT_MIN_INTERVAL,
-        'rate_limit_cache_duration': RATE_LIMIT_CACHE_DURATION,
-        'max_calls_per_minute': RATE_LIMIT_MAX_CALLS_PER_MINUTE,
-        'fastapi_host': FASTAPI_HOST,
-        'fastapi_port': FASTAPI_PORT,
-        'streamlit_port': STREAMLIT_PORT,
-        'time_range_options': TIME_RANGE_OPTIONS,
-    })
\ No newline at end of file
+    USER_PARAMETERS.update(_RESET_DEFAULTS)
\ No newline at end of file
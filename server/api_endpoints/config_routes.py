@@ -6,7 +6,7 @@ Handles user parameters and application configuration
 from fastapi import APIRouter, HTTPException
 from datetime import datetime
 
-from core.config import get_all_user_parameters, update_user_parameters, reset_user_parameters, MESSAGES, HTTP_INTERNAL_ERROR
+from core.config import snapshot_user_parameters, update_user_parameters, reset_user_parameters, MESSAGES, HTTP_INTERNAL_ERROR
 
 router = APIRouter()
 
@@ -14,7 +14,7 @@ router = APIRouter()
 async def get_user_parameters():
     """Get current user parameters configuration"""
     return {
-        "user_parameters": get_all_user_parameters(),
+        "user_parameters": snapshot_user_parameters(),
         "timestamp": datetime.utcnow().isoformat()
     }
 
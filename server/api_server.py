@@ -4,6 +4,7 @@ Orchestrates all API endpoints and handles application startup with dependency i
 """
 
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 import logging
 
 # Set up comprehensive logging first
@@ -18,13 +19,16 @@ from .api_endpoints.data_routes import router as data_router
 from .api_endpoints.config_routes import router as config_router
 from .api_endpoints.system_routes import router as system_router
 from .api_endpoints.debug_routes import router as debug_router
-from core.config import APP_TITLE, APP_VERSION, FASTAPI_HOST, FASTAPI_PORT, DATABASE_URL
+from core.config import APP_TITLE, APP_VERSION, FASTAPI_HOST, FASTAPI_PORT, DATABASE_URL, GZIP_MINIMUM_SIZE
 
 logger = get_logger("server.api_server")
 
 # Create FastAPI application
 app = FastAPI(title=APP_TITLE, version=APP_VERSION)
 
+# Compress larger JSON responses (price history arrays are highly repetitive)
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
+
 # Include all routers
 app.include_router(crypto_router)
 app.include_router(data_router)
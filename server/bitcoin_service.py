@@ -1,4 +1,5 @@
-import requests
+import httpx
+import orjson
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
@@ -10,6 +11,9 @@ from core.config import *
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared async HTTP client - keeps CoinGecko connections alive between calls
+_http_client = httpx.AsyncClient(timeout=API_REQUEST_TIMEOUT)
+
 class BitcoinService:
     def __init__(self):
         self.base_url = COINGECKO_BASE_URL
@@ -29,10 +33,10 @@ class BitcoinService:
             url = f"{self.base_url}/simple/price"
             params = COINGECKO_PARAMS
             
-            response = requests.get(url, params=params, timeout=API_REQUEST_TIMEOUT)
+            response = await _http_client.get(url, params=params)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             bitcoin_data = data['bitcoin']
             
             price_data = {
@@ -48,11 +52,11 @@ class BitcoinService:
             logger.info(f"Fetched Bitcoin price: ${price_data['price']:,.2f}")
             return price_data
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Error fetching Bitcoin price: {e}")
             
             # Handle rate limit errors specially
-            is_rate_limit = hasattr(e, 'response') and e.response and e.response.status_code == HTTP_RATE_LIMIT
+            is_rate_limit = isinstance(e, httpx.HTTPStatusError) and e.response.status_code == HTTP_RATE_LIMIT
             global_rate_limiter.record_failed_call(is_rate_limit_error=is_rate_limit)
             
             # Return cached data if available, even if expired
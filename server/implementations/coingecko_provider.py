@@ -4,6 +4,7 @@ Concrete implementation of CryptoDataProvider using CoinGecko API
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 import logging
@@ -21,6 +22,10 @@ class CoinGeckoProvider(CryptoDataProvider):
         self.base_url = base_url
         self.timeout = timeout
         self.provider_name = "CoinGecko"
+        
+        # Reuse one keep-alive connection pool for every CoinGecko request
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
     
     async def fetch_current_price(self, symbol: str = "bitcoin") -> Optional[PriceData]:
         """Fetch current price from CoinGecko API"""
@@ -34,7 +39,7 @@ class CoinGeckoProvider(CryptoDataProvider):
                 'include_last_updated_at': 'true'
             }
             
-            response = requests.get(url, params=params, timeout=self.timeout)
+            response = self._session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
             
             data = response.json()
@@ -71,7 +76,7 @@ class CoinGeckoProvider(CryptoDataProvider):
                 'interval': 'daily' if days > 1 else 'hourly'
             }
             
-            response = requests.get(url, params=params, timeout=self.timeout)
+            response = self._session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
             
             data = response.json()
@@ -107,7 +112,7 @@ class CoinGeckoProvider(CryptoDataProvider):
         """Get list of supported cryptocurrency symbols from CoinGecko"""
         try:
             url = f"{self.base_url}/coins/list"
-            response = requests.get(url, timeout=self.timeout)
+            response = self._session.get(url, timeout=self.timeout)
             response.raise_for_status()
             
             data = response.json()
@@ -127,7 +132,7 @@ class CoinGeckoProvider(CryptoDataProvider):
         """Check if CoinGecko API is accessible"""
         try:
             url = f"{self.base_url}/ping"
-            response = requests.get(url, timeout=self.timeout)
+            response = self._session.get(url, timeout=self.timeout)
             
             if response.status_code == 200:
                 logger.debug("CoinGecko API health check passed")
@@ -1,7 +1,9 @@
+import numpy as np
 import pandas as pd
 import threading
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+from core.config import SHARED_DATA_CAPACITY
 
 class SharedDataStore:
     """Singleton class to share data between scheduler and GUI"""
@@ -18,42 +20,76 @@ class SharedDataStore:
     
     def __init__(self):
         if not self._initialized:
-            self.data_series = pd.Series(dtype=float, name='bitcoin_price')
+            # Parallel fixed-size ring buffers (UTC epoch nanoseconds + price) with a write cursor
+            self._capacity = SHARED_DATA_CAPACITY
+            self._timestamps = np.empty(self._capacity, dtype=np.int64)
+            self._prices = np.empty(self._capacity, dtype=np.float64)
+            self._count = 0  # total prices written since the last clear
             self._data_lock = threading.Lock()
             self._initialized = True
     
+    def _ordered_window(self, limit: int = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the newest entries in chronological order (caller must hold the data lock)"""
+        size = min(self._count, self._capacity)
+        if limit is not None:
+            size = max(min(size, limit), 0)
+        
+        end = self._count % self._capacity
+        start = end - size
+        if start >= 0:
+            return self._timestamps[start:end].copy(), self._prices[start:end].copy()
+        
+        # Window wraps around the end of the buffer
+        return (
+            np.concatenate((self._timestamps[start:], self._timestamps[:end])),
+            np.concatenate((self._prices[start:], self._prices[:end]))
+        )
+    
     def add_price(self, price: float, timestamp: datetime = None) -> None:
         """Thread-safe method to add price data"""
         if timestamp is None:
             timestamp = datetime.utcnow()
         
+        # Store as naive UTC nanoseconds
+        ts = pd.Timestamp(timestamp)
+        if ts.tzinfo is not None:
+            ts = ts.tz_convert('UTC').tz_localize(None)
+        
         with self._data_lock:
-            self.data_series[timestamp] = price
+            slot = self._count % self._capacity
+            self._timestamps[slot] = ts.as_unit('ns').value
+            self._prices[slot] = price
+            self._count += 1
     
     def get_recent_data(self, limit: int = 100) -> pd.Series:
         """Thread-safe method to get recent data"""
         with self._data_lock:
-            return self.data_series.tail(limit).copy()
+            timestamps, prices = self._ordered_window(limit)
+        
+        index = pd.DatetimeIndex(timestamps.view('datetime64[ns]'))
+        return pd.Series(prices, index=index, name='bitcoin_price')
     
     def get_statistics(self) -> Dict[str, Any]:
         """Thread-safe method to get statistics"""
         with self._data_lock:
-            if len(self.data_series) == 0:
-                return {}
-            
-            return {
-                'count': len(self.data_series),
-                'mean': float(self.data_series.mean()),
-                'std': float(self.data_series.std()),
-                'min': float(self.data_series.min()),
-                'max': float(self.data_series.max()),
-                'latest': float(self.data_series.iloc[-1]) if len(self.data_series) > 0 else None
-            }
+            _, prices = self._ordered_window()
+        
+        if len(prices) == 0:
+            return {}
+        
+        return {
+            'count': len(prices),
+            'mean': float(prices.mean()),
+            'std': float(prices.std(ddof=1)) if len(prices) > 1 else float('nan'),
+            'min': float(prices.min()),
+            'max': float(prices.max()),
+            'latest': float(prices[-1])
+        }
     
     def clear_data(self) -> None:
         """Thread-safe method to clear all data"""
         with self._data_lock:
-            self.data_series = pd.Series(dtype=float, name='bitcoin_price')
+            self._count = 0
 
 # Global instance
 shared_data = SharedDataStore()
\ No newline at end of file
@@ -1,7 +1,7 @@
 import asyncio
 from server.bitcoin_service import BitcoinService
 from server.database import SessionLocal, BitcoinPrice
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -21,16 +21,19 @@ def check_database():
             print("ERROR: No data in database")
             return False
         
+        # Stored timestamps are naive UTC, so compare against a naive copy of the current time
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        
         # Get most recent entries
         recent_entries = db.query(BitcoinPrice).order_by(BitcoinPrice.timestamp.desc()).limit(5).all()
         
         print(f"Most recent {len(recent_entries)} entries:")
         for i, entry in enumerate(recent_entries):
-            age = datetime.utcnow() - entry.timestamp
+            age = now - entry.timestamp
             print(f"   {i+1}. ${entry.price:,.2f} at {entry.timestamp} (age: {age})")
         
         # Check if we have recent data (within last hour)
-        one_hour_ago = datetime.utcnow() - timedelta(hours=1)
+        one_hour_ago = now - timedelta(hours=1)
         recent_count = db.query(BitcoinPrice).filter(BitcoinPrice.timestamp > one_hour_ago).count()
         
         print(f"Entries in last hour: {recent_count}")
@@ -1,16 +1,22 @@
 import asyncio
 from server.bitcoin_service import BitcoinService
 from server.database import SessionLocal, BitcoinPrice
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import case, func
 import logging
+import requests
+from requests.adapters import HTTPAdapter
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-async def test_api_fetch():
-    """Test if we can fetch current Bitcoin price"""
+# Keep-alive session so repeated CoinGecko checks reuse the TLS connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+async def _fetch_once(service):
+    """Fetch and report the current Bitcoin price, returning the price data or None"""
     print("🔍 Testing API fetch...")
-    service = BitcoinService()
     
     try:
         price_data = await service.fetch_bitcoin_price()
@@ -19,13 +25,17 @@ async def test_api_fetch():
             print(f"   Timestamp: {price_data['timestamp']}")
             print(f"   Market Cap: ${price_data.get('market_cap', 0):,.0f}")
             print(f"   24h Volume: ${price_data.get('volume_24h', 0):,.0f}")
-            return True
+            return price_data
         else:
             print("❌ API fetch failed - no data returned")
-            return False
+            return None
     except Exception as e:
         print(f"❌ API fetch error: {e}")
-        return False
+        return None
+
+async def test_api_fetch():
+    """Test if we can fetch current Bitcoin price"""
+    return await _fetch_once(BitcoinService()) is not None
 
 def check_database():
     """Check recent database entries"""
@@ -33,8 +43,16 @@ def check_database():
     db = SessionLocal()
     
     try:
-        # Count total entries
-        total_count = db.query(BitcoinPrice).count()
+        now = datetime.now(timezone.utc)  # one reference time for every age below
+        # Stored timestamps are naive UTC, so compare against a naive copy
+        now_naive = now.replace(tzinfo=None)
+        one_hour_ago = now_naive - timedelta(hours=1)
+        
+        # Count total entries and those from the last hour in a single aggregate query
+        total_count, recent_count = db.query(
+            func.count(BitcoinPrice.id),
+            func.count(case((BitcoinPrice.timestamp > one_hour_ago, 1)))
+        ).one()
         print(f"📊 Total database entries: {total_count}")
         
         if total_count == 0:
@@ -46,13 +64,10 @@ def check_database():
         
         print(f"📈 Most recent {len(recent_entries)} entries:")
         for i, entry in enumerate(recent_entries):
-            age = datetime.utcnow() - entry.timestamp
+            age = now_naive - entry.timestamp
             print(f"   {i+1}. ${entry.price:,.2f} at {entry.timestamp} (⏰ {age} ago)")
         
         # Check if we have recent data (within last hour)
-        one_hour_ago = datetime.utcnow() - timedelta(hours=1)
-        recent_count = db.query(BitcoinPrice).filter(BitcoinPrice.timestamp > one_hour_ago).count()
-        
         if recent_count > 0:
             print(f"✅ Found {recent_count} entries in the last hour")
             return True
@@ -66,30 +81,32 @@ def check_database():
     finally:
         db.close()
 
+def _bulk_write_prices(db, price_dicts):
+    """Insert price rows in one batched statement, bypassing per-object unit-of-work bookkeeping"""
+    db.bulk_insert_mappings(BitcoinPrice, price_dicts)
+    db.commit()
+
 async def test_full_collection():
     """Test a complete data collection cycle"""
     print("\n🔍 Testing full collection cycle...")
     
-    # Test API fetch
-    api_ok = await test_api_fetch()
-    if not api_ok:
+    # Test API fetch; the same result is reused for the database write
+    service = BitcoinService()
+    price_data = await _fetch_once(service)
+    if price_data is None:
         return False
     
     # Test database write
-    service = BitcoinService()
     try:
-        price_data = await service.fetch_bitcoin_price()
         if price_data:
             db = SessionLocal()
             try:
-                db_price = BitcoinPrice(
-                    price=price_data['price'],
-                    timestamp=price_data['timestamp'],
-                    volume_24h=price_data.get('volume_24h'),
-                    market_cap=price_data.get('market_cap')
-                )
-                db.add(db_price)
-                db.commit()
+                _bulk_write_prices(db, [{
+                    'price': price_data['price'],
+                    'timestamp': price_data['timestamp'],
+                    'volume_24h': price_data.get('volume_24h'),
+                    'market_cap': price_data.get('market_cap')
+                }])
                 print("✅ Database write successful")
                 
                 # Test pandas series
@@ -112,11 +129,10 @@ async def test_full_collection():
 def check_coingecko_rate_limits():
     """Check if we're hitting CoinGecko rate limits"""
     print("\n🔍 Checking CoinGecko API status...")
-    import requests
     
     try:
         # Test with a simple ping
-        response = requests.get("https://api.coingecko.com/api/v3/ping", timeout=10)
+        response = _SESSION.get("https://api.coingecko.com/api/v3/ping", timeout=10)
         if response.status_code == 200:
             print("✅ CoinGecko API is accessible")
             
@@ -1,6 +1,6 @@
 from server.database import SessionLocal, BitcoinPrice
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timezone
 
 def test_gui_query(limit=10):
     """Test the GUI database query"""
@@ -14,8 +14,10 @@ def test_gui_query(limit=10):
         
         if prices:
             print(f"Retrieved {len(prices)} entries:")
+            # Stored timestamps are naive UTC, so compare against a naive copy of the current time
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
             for i, price in enumerate(prices):
-                age = datetime.utcnow() - price.timestamp
+                age = now - price.timestamp
                 print(f"   {i+1}. ${price.price:,.2f} at {price.timestamp} (age: {age})")
             
             # Create DataFrame like GUI does